@@ -0,0 +1,97 @@
+"""
+Shared caching helpers for the agents.
+  get_ticker(symbol)  — one yf.Ticker per symbol per process (lru_cache)
+  FileCache           — tiny JSON-on-disk key/value store with a TTL
+  short_name(symbol)  — company shortName, cached on disk for 90 days
+  ticker_news(symbol) — yfinance news list, cached on disk for 1h
+"""
+
+import os, json, time
+from functools import lru_cache
+from pathlib import Path
+
+CACHE_DIR = Path.home() / 'investment-agents' / '.cache'
+
+
+@lru_cache(maxsize=128)
+def get_ticker(symbol: str):
+    import yfinance as yf
+    return yf.Ticker(symbol)
+
+
+class FileCache:
+    """One JSON file per key in `directory`, valid for `ttl` seconds after it was written.
+    Unreadable or half-written files count as a miss; writes replace the file atomically."""
+
+    def __init__(self, directory: Path = CACHE_DIR, ttl: float = 24 * 3600):
+        self.directory = Path(directory)
+        self.ttl       = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def get(self, key: str, default=None, ttl: float | None = None):
+        """Cached value for `key`, or `default` if missing, unreadable or older than
+        `ttl` (defaults to the cache's own TTL)."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime < (self.ttl if ttl is None else ttl):
+                return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            pass
+        return default
+
+    def set(self, key: str, value) -> None:
+        path = self._path(key)
+        tmp  = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(value), encoding='utf-8')
+            os.replace(tmp, path)   # a killed run never leaves a truncated entry
+        except OSError:
+            pass   # caching is best-effort
+
+    def prune(self) -> None:
+        """Delete entries older than the TTL (for caches whose keys keep changing)."""
+        cutoff = time.time() - self.ttl
+        try:
+            for path in self.directory.glob('*.json'):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+# Company names are effectively static — keep them for a quarter
+_info_cache = FileCache(ttl=90 * 24 * 3600)
+
+
+def short_name(symbol: str) -> str | None:
+    """shortName for `symbol` — from the 90-day disk cache, else yfinance .info.
+    Returns None if the lookup failed (failures are not cached)."""
+    cached = _info_cache.get(f'{symbol}_info')
+    if cached is not None:
+        return cached.get('shortName', symbol)
+    try:
+        name = (get_ticker(symbol).info or {}).get('shortName', symbol)
+    except Exception:
+        return None
+    _info_cache.set(f'{symbol}_info', {'shortName': name})
+    return name
+
+
+_news_cache = FileCache(CACHE_DIR / 'news', ttl=3600)
+
+
+def ticker_news(symbol: str) -> list:
+    """yfinance news for `symbol` — from the 1h disk cache (one file per ticker, shared
+    across agents and overwritten on refresh), else fetched. Returns [] on failure (not cached)."""
+    cached = _news_cache.get(symbol)
+    if cached is not None:
+        return cached
+    try:
+        news = get_ticker(symbol).news or []
+    except Exception:
+        return []
+    _news_cache.set(symbol, news)
+    return news
@@ -0,0 +1,61 @@
+"""
+Shared HTTP session for the agents.
+  SESSION — one requests.Session with a small keep-alive pool, so repeat
+            calls to the same host (e.g. api.groq.com) skip the TCP+TLS handshake.
+            Sends a browser User-Agent (stockanalysis.com needs one) and retries
+            failed connections twice.
+  groq_stream(...) — streamed Groq chat completion over SESSION, with an early
+            stop when the reply opens with a given prefix (e.g. NO_IMPACT)
+"""
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=2))
+
+GROQ_URL   = 'https://api.groq.com/openai/v1/chat/completions'
+GROQ_MODEL = 'llama-3.1-8b-instant'
+
+
+def groq_stream(api_key: str, prompt: str, max_tokens: int, stop_prefix: str = '',
+                model: str = GROQ_MODEL) -> str:
+    """Groq completion text for `prompt`, read as a stream. Raises on HTTP errors and
+    on an empty completion (e.g. a 200 page with no SSE chunks). If the reply opens
+    with `stop_prefix`, the stream is dropped right there and just that prefix is returned."""
+    parts = []
+    with SESSION.post(
+        GROQ_URL,
+        headers={'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'},
+        json={
+            'model':       model,
+            'max_tokens':  max_tokens,
+            'temperature': 0.3,
+            'stream':      True,
+            'messages':    [{'role': 'user', 'content': prompt}],
+        },
+        timeout=30,
+        stream=True,
+    ) as res:
+        res.raise_for_status()
+        # Server-sent events: `data: {chunk json}` lines, terminated by `data: [DONE]`
+        for line in res.iter_lines():
+            if not line.startswith(b'data: '):
+                continue
+            data = line[len(b'data: '):]
+            if data == b'[DONE]':
+                break
+            parts.append(json.loads(data)['choices'][0].get('delta', {}).get('content') or '')
+            if stop_prefix:
+                head = ''.join(parts).lstrip().upper()
+                if head.startswith(stop_prefix):
+                    return stop_prefix
+                if len(head) >= len(stop_prefix):
+                    stop_prefix = ''   # it's a real answer — stop checking
+    text = ''.join(parts).strip()
+    if not text:
+        raise ValueError('Groq returned an empty completion')
+    return text
@@ -0,0 +1,35 @@
+"""
+Seen-IPO state shared by ipo_scout and daily_report.
+  load_ipo_seen()    — every symbol either agent has already shown
+  save_ipo_seen(new) — append newly shown symbols; the file is never rewritten
+
+state/ipo_seen.ndjson holds one symbol per line. The older ipo_seen.json list is
+still read, so symbols recorded before the switch keep counting as seen.
+"""
+
+from pathlib import Path
+
+import orjson
+
+STATE_DIR   = Path.home() / 'investment-agents' / 'state'
+IPO_SEEN_F  = STATE_DIR / 'ipo_seen.ndjson'   # one symbol per line, append-only
+IPO_SEEN_V1 = STATE_DIR / 'ipo_seen.json'     # legacy JSON list, read-only now
+
+
+def load_ipo_seen() -> set:
+    try:
+        seen = set(orjson.loads(IPO_SEEN_V1.read_bytes()))
+    except (OSError, ValueError):
+        seen = set()
+    if IPO_SEEN_F.exists():
+        seen.update(IPO_SEEN_F.read_text().split())
+    return seen
+
+
+def save_ipo_seen(new: set) -> None:
+    """Append symbols not seen before — O(new) per run."""
+    if not new:
+        return
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    with IPO_SEEN_F.open('a') as f:
+        f.writelines(sym + '\n' for sym in sorted(new))
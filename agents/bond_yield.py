@@ -7,38 +7,99 @@ Shows current rate, daily change in basis points, and investor context.
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-import yfinance as yf
+import functools
+from bisect import bisect_right
 from datetime import datetime
+from _cache import CACHE_DIR, FileCache
 
+YF_CACHE_DIR    = CACHE_DIR / 'yf'
+CACHE_TTL_HOURS = 6
 
-def get_10y_yield() -> dict | None:
-    """Fetch current and previous close for ^TNX. Returns dict or None."""
+
+def cached_ticker(symbol: str, ttl_hours: float = CACHE_TTL_HOURS):
+    """Cache a dict-returning fetch for `symbol` in .cache/yf/, one file per symbol.
+    A cached result younger than ttl_hours is returned without touching the network;
+    None results are never cached so a failed fetch is retried on the next run."""
+    cache = FileCache(YF_CACHE_DIR, ttl=ttl_hours * 3600)
+    key   = 'yf_' + symbol.lstrip('^').lower()
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            data = cache.get(key)
+            if data is None:
+                data = fn(*args, **kwargs)
+                if data is not None:
+                    cache.set(key, data)
+            return data
+        return wrapper
+    return decorator
+
+
+def _num(v) -> float | None:
+    """float(v), or None for NaN (a ticker with no close on that row)."""
+    return None if v != v else float(v)
+
+
+def get_yields(tickers: tuple[str, ...] = ('^TNX',)) -> dict[str, dict | None]:
+    """Fetch current and previous close for each yield ticker in one batched request.
+    Returns {ticker: {'yield', 'prev', 'change', 'bps'} or None}."""
+    import yfinance as yf   # deferred: pulls in pandas/numpy, not needed on a cache hit
     try:
-        hist = yf.Ticker('^TNX').history(period='5d')
-        if hist.empty:
-            return None
-        current = round(float(hist['Close'].iloc[-1]), 3)
-        prev    = round(float(hist['Close'].iloc[-2]), 3) if len(hist) >= 2 else None
-        change  = round(current - prev, 3) if prev is not None else None
-        bps     = round(change * 100, 1)   if change is not None else None
-        return {'yield': current, 'prev': prev, 'change': change, 'bps': bps}
+        # Raw closes only: no dividend/split adjustment pass, no action columns
+        df = yf.download(list(tickers), period='5d', group_by='ticker', threads=True,
+                         progress=False, auto_adjust=False, actions=False)
+        if df.empty:
+            return {t: None for t in tickers}
+        if df.columns.nlevels > 1:
+            closes = df.xs('Close', level=1, axis=1)
+        else:   # older yfinance returns flat columns for a single ticker
+            closes = df[['Close']].set_axis(list(tickers[:1]), axis=1)
+        closes = closes.dropna(how='all')
+        col    = {t: i for i, t in enumerate(closes.columns)}
+        arr    = closes.to_numpy(dtype=float)
+
+        current = arr[-1].round(3)
+        prev    = arr[-2].round(3) if len(arr) >= 2 else current * float('nan')
+        change  = (current - prev).round(3)
+        bps     = (change * 100).round(1)
     except Exception:
-        return None
+        return {t: None for t in tickers}
+
+    out = {}
+    for t in tickers:
+        i = col.get(t)
+        y = _num(current[i]) if i is not None else None
+        out[t] = None if y is None else {
+            'yield': y, 'prev': _num(prev[i]), 'change': _num(change[i]), 'bps': _num(bps[i]),
+        }
+    return out
+
+
+@cached_ticker('^TNX')
+def get_10y_yield() -> dict | None:
+    """Fetch current and previous close for ^TNX. Returns dict or None."""
+    return get_yields(('^TNX',))['^TNX']
+
+
+# Upper bounds (exclusive) of each yield band, and the context line for each band.
+# bisect_right() over the bounds picks the band in one lookup instead of an if/elif chain.
+_CTX_BOUNDS = (2.5, 3.5, 4.0, 4.5, 5.0)
+_CTX_MSG    = (
+    'Very low — historically accommodative, supportive of equities',
+    'Low-moderate — broadly supportive for growth stocks',
+    'Moderate — neutral; watch for direction',
+    'Elevated — pressure on valuations, especially high-growth names',
+    'High — restrictive; watch rate-sensitive sectors (tech, real estate)',
+    'Very high — significant headwind for growth stocks; recession risk watch',
+)
+
+# (arrow, sign) for a daily change, indexed by `change > 0`
+_CHANGE_MARKS = (('▼', ''), ('▲', '+'))
 
 
 def yield_context(y: float) -> str:
-    if y < 2.5:
-        return 'Very low — historically accommodative, supportive of equities'
-    elif y < 3.5:
-        return 'Low-moderate — broadly supportive for growth stocks'
-    elif y < 4.0:
-        return 'Moderate — neutral; watch for direction'
-    elif y < 4.5:
-        return 'Elevated — pressure on valuations, especially high-growth names'
-    elif y < 5.0:
-        return 'High — restrictive; watch rate-sensitive sectors (tech, real estate)'
-    else:
-        return 'Very high — significant headwind for growth stocks; recession risk watch'
+    return _CTX_MSG[bisect_right(_CTX_BOUNDS, y)]
 
 
 def main():
@@ -56,12 +117,7 @@ def main():
     change = data['change']
     bps    = data['bps']
 
-    if change is None:
-        arrow, sign = '─', ''
-    elif change > 0:
-        arrow, sign = '▲', '+'
-    else:
-        arrow, sign = '▼', ''
+    arrow, sign = _CHANGE_MARKS[change > 0] if change is not None else ('─', '')
 
     print(f"  Current Yield : {y:.3f}%")
     if change is not None:
@@ -10,15 +10,18 @@ import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
 import yfinance as yf
-import requests
 import os
-import json
+import re
+import orjson
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from _http import SESSION
 
 def _load_groq_key() -> str:
     try:
-        cfg = json.loads((Path.home() / 'investment-agents/config/email_config.json').read_text())
+        cfg = orjson.loads((Path.home() / 'investment-agents/config/email_config.json').read_bytes())
         return cfg.get('groq_api_key', '')
     except Exception:
         return ''
@@ -28,16 +31,26 @@ GROQ_KEY = _load_groq_key() or os.environ.get('GROQ_API_KEY', '')
 # Tickers to pull news from — broad market coverage
 NEWS_TICKERS = ['SPY', 'QQQ', 'DIA', 'AAPL', 'MSFT', 'NVDA', 'META', 'TSLA', 'AMZN', 'GOOGL']
 
+def _ticker_news(ticker: str) -> list:
+    """Raw yfinance news list for one ticker; empty on any fetch error."""
+    try:
+        return yf.Ticker(ticker).news or []
+    except Exception:
+        return []
+
 def fetch_market_news(max_items: int = 20) -> list[dict]:
     """Collect recent headlines from major market tickers, deduplicated.
-    Handles both the legacy flat structure and the newer nested 'content' structure."""
+    Handles both the legacy flat structure and the newer nested 'content' structure.
+    Tickers are fetched concurrently; dedup runs afterwards in NEWS_TICKERS order."""
     articles   = []
     seen_titles: set[str] = set()
 
-    for ticker in NEWS_TICKERS:
-        try:
-            news = yf.Ticker(ticker).news or []
-            for item in news:
+    with ThreadPoolExecutor(max_workers=len(NEWS_TICKERS)) as executor:
+        results = list(executor.map(_ticker_news, NEWS_TICKERS))
+
+    for news in results:
+        for item in news:
+            try:
                 # New nested structure: item['content']['title']
                 content = item.get('content', item)  # fall back to item itself for legacy
                 title   = content.get('title', '').strip()
@@ -51,16 +64,16 @@ def fetch_market_news(max_items: int = 20) -> list[dict]:
                 publisher = publisher or item.get('publisher', '')
 
                 summary = content.get('summary', '') or content.get('description', '')
+            except Exception:
+                continue
 
-                articles.append({
-                    'title':     title,
-                    'publisher': publisher,
-                    'summary':   summary[:300],
-                })
-                if len(articles) >= max_items:
-                    return articles
-        except Exception:
-            continue
+            articles.append({
+                'title':     title,
+                'publisher': publisher,
+                'summary':   summary[:300],
+            })
+            if len(articles) >= max_items:
+                return articles
 
     return articles
 
@@ -74,7 +87,7 @@ def summarize_with_groq(articles: list[dict]) -> str:
         for a in articles
     )
 
-    response = requests.post(
+    response = SESSION.post(
         'https://api.groq.com/openai/v1/chat/completions',
         headers={
             'Authorization': f'Bearer {api_key}',
@@ -99,13 +112,23 @@ def summarize_with_groq(articles: list[dict]) -> str:
         timeout=30,
     )
     response.raise_for_status()
-    return response.json()['choices'][0]['message']['content'].strip()
+    return orjson.loads(response.content)['choices'][0]['message']['content'].strip()
+
+BULLISH_WORDS = ['surge', 'rally', 'beat', 'record', 'gain', 'rise', 'strong', 'growth']
+BEARISH_WORDS = ['fall', 'drop', 'miss', 'concern', 'fear', 'risk', 'weak', 'decline']
+
+# One alternation with a named group per polarity: a single scan of the summary
+# counts every keyword, instead of one str.count() pass per word.
+_MOOD_RE = re.compile(
+    f"(?P<bull>{'|'.join(BULLISH_WORDS)})|(?P<bear>{'|'.join(BEARISH_WORDS)})"
+)
 
 def market_mood(summary: str) -> str:
     """Simple keyword-based mood indicator."""
-    s = summary.lower()
-    bullish  = sum(s.count(w) for w in ['surge', 'rally', 'beat', 'record', 'gain', 'rise', 'strong', 'growth'])
-    bearish  = sum(s.count(w) for w in ['fall', 'drop', 'miss', 'concern', 'fear', 'risk', 'weak', 'decline'])
+    counts = {'bull': 0, 'bear': 0}
+    for m in _MOOD_RE.finditer(summary.lower()):
+        counts[m.lastgroup] += 1
+    bullish, bearish = counts['bull'], counts['bear']
     if bullish > bearish + 1:
         return '🟢 Bullish'
     elif bearish > bullish + 1:
@@ -17,14 +17,19 @@ Config:   ~/investment-agents/config/email_config.json
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-import os, json, smtplib, requests
+import os, re, json, hashlib, smtplib
 from datetime import datetime, timedelta, date
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-import yfinance as yf
-from bs4 import BeautifulSoup
+from _cache import CACHE_DIR, FileCache, get_ticker, short_name, ticker_news
+from _state import load_ipo_seen, save_ipo_seen   # seen-IPO log shared with ipo_scout
+
+# yfinance (→ pandas/numpy), requests and lxml are imported inside the functions
+# that use them, so importing this module or a section that needs none of them
+# doesn't pay their startup cost. After the first import they come from sys.modules.
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 BASE        = Path.home() / 'investment-agents'
@@ -33,7 +38,6 @@ STATE_DIR   = BASE / 'state'
 EMAIL_CFG   = CONFIG_DIR / 'email_config.json'
 WATCHLIST_F = CONFIG_DIR / 'watchlist.json'
 IPO_CFG_F   = CONFIG_DIR / 'ipo_config.json'
-IPO_STATE_F = STATE_DIR  / 'ipo_seen.json'
 
 # ── Load config ───────────────────────────────────────────────────────────────
 def load_json(path, default):
@@ -51,38 +55,118 @@ ALERT_TICKERS = {
 }
 
 # ── Helper ────────────────────────────────────────────────────────────────────
-def get_price(ticker: str):
+# One yf.Ticker per symbol for the whole report: sections touching the same
+# ticker (e.g. ALAB in earnings, price and stock news) share its cached lookups.
+# Same memo as _cache.ticker_news uses, so news and calendar/.info share it too.
+_tk = get_ticker
+
+def fetch_closes(symbols, period: str = '5d') -> dict[str, list[float]]:
+    """yf.download for every symbol → {symbol: daily closes, oldest first}. yfinance
+    still fetches each symbol separately; threads=True runs those requests in parallel.
+    Symbols Yahoo returned nothing for map to []; {} if the download itself failed."""
+    import yfinance as yf
+    symbols = list(symbols)
     try:
-        hist = yf.Ticker(ticker).history(period='1d')
-        return round(float(hist['Close'].iloc[-1]), 2) if not hist.empty else None
+        df = yf.download(symbols, period=period, group_by='ticker', threads=True, progress=False)
     except Exception:
-        return None
+        return {}
+    closes = {}
+    for sym in symbols:
+        try:
+            col = df[sym]['Close'] if df.columns.nlevels > 1 else df['Close']
+            closes[sym] = [float(v) for v in col.dropna()]
+        except Exception:
+            closes[sym] = []
+    return closes
+
+# Known display names for the default watchlist and alert tickers — no lookup needed
+TICKER_NAMES = {
+    'ALAB': 'Astera Labs',          'AMD':  'Advanced Micro Devices',
+    'AMZN': 'Amazon',               'CRM':  'Salesforce',
+    'HOOD': 'Robinhood Markets',    'IT':   'Gartner',
+    'MSFT': 'Microsoft',            'NVDA': 'NVIDIA',
+    'RIVN': 'Rivian Automotive',    'SMCI': 'Super Micro Computer',
+    'TSLA': 'Tesla',                'TSM':  'Taiwan Semiconductor',
+    'VRTX': 'Vertex Pharmaceuticals',
+}
 
 def ticker_name(ticker: str) -> str:
+    """Static TICKER_NAMES first, then the shared shortName disk cache."""
+    return TICKER_NAMES.get(ticker) or short_name(ticker) or ticker
+
+def iter_news_lists(tickers):
+    """Fetch .news for every ticker concurrently, yielding the lists in input order.
+    If the caller stops iterating early, queued fetches are cancelled and
+    in-flight ones are no longer waited for."""
+    tickers = list(tickers)
+    ex = ThreadPoolExecutor(max_workers=min(8, len(tickers)))
     try:
-        return yf.Ticker(ticker).info.get('shortName', ticker)
-    except Exception:
-        return ticker
+        yield from ex.map(ticker_news, tickers)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+def _session():
+    """The shared keep-alive session from _http, for Groq and stockanalysis.com.
+    Imported on first use so requests stays lazy."""
+    from _http import SESSION
+    return SESSION
+
+# ── Groq ──────────────────────────────────────────────────────────────────────
+# Responses, one file per prompt hash; anything older than a day is pruned
+_groq_cache = FileCache(CACHE_DIR / 'groq', ttl=86400)
+
+def _groq_call(prompt: str, max_tokens: int, ttl_secs: int, stop_prefix: str = '') -> str:
+    """Groq completion for `prompt`, reusing a cached response younger than ttl_secs.
+    Cache: .cache/groq/, keyed by sha1(model + prompt); a missing or unreadable entry
+    is just a miss. Raises on HTTP errors. The call itself is _http.groq_stream, so a
+    reply opening with `stop_prefix` (e.g. NO_IMPACT) is cut off there and just that
+    prefix is returned."""
+    from _http import GROQ_MODEL, groq_stream
+    key    = hashlib.sha1((GROQ_MODEL + prompt).encode()).hexdigest()
+    cached = _groq_cache.get(key, ttl=ttl_secs)
+    if isinstance(cached, str):
+        return cached
+
+    text = groq_stream(GROQ_KEY, prompt, max_tokens, stop_prefix)
+
+    _groq_cache.set(key, text)
+    _groq_cache.prune()
+    return text
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SECTION 1 — Market News (Agent D logic)
 # ─────────────────────────────────────────────────────────────────────────────
 NEWS_TICKERS = ['SPY','QQQ','DIA','AAPL','MSFT','NVDA','META','TSLA','AMZN','GOOGL']
 
-def fetch_market_news(max_items=20):
+# Mood keywords — substring matches, like daily_news.market_mood, so inflected
+# forms ('surged', 'gains', 'risks', 'declines') still count
+_BULL_RE = re.compile(r'surge|rally|beat|record|gain|rise|strong|growth')
+_BEAR_RE = re.compile(r'fall|drop|miss|concern|fear|risk|weak|decline')
+
+# **bold** markup in Groq output (news + stock summary)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+# Runs of whitespace, collapsed when building a headline's dedup key
+_WS_RE = re.compile(r'\s+')
+
+def fetch_market_news(max_items=20) -> list[str]:
+    """Deduplicated headlines, already formatted as prompt lines:
+    '- title [publisher]' plus an indented summary line when there is one."""
     articles, seen = [], set()
-    for t in NEWS_TICKERS:
+    for news in iter_news_lists(NEWS_TICKERS):
         try:
-            for item in (yf.Ticker(t).news or []):
+            for item in news:
                 content   = item.get('content', item)
                 title     = content.get('title', '').strip()
-                if not title or title in seen:
+                key       = _WS_RE.sub(' ', title).lower()
+                if not title or key in seen:
                     continue
-                seen.add(title)
+                seen.add(key)
                 provider  = content.get('provider', {})
                 publisher = (provider.get('displayName', '') if isinstance(provider, dict) else '') or item.get('publisher', '')
                 summary   = content.get('summary', '') or content.get('description', '')
-                articles.append({'title': title, 'publisher': publisher, 'summary': summary[:300]})
+                articles.append(f"- {title} [{publisher}]" + (f"\n  {summary[:300]}" if summary else ''))
                 if len(articles) >= max_items:
                     return articles
         except Exception:
@@ -98,37 +182,23 @@ def build_news_section() -> tuple[str, str]:
     if not articles:
         return '', '  Could not fetch news.\n'
 
-    headlines = '\n'.join(
-        f"- {a['title']} [{a['publisher']}]" + (f"\n  {a['summary']}" if a['summary'] else '')
-        for a in articles
+    headlines = '\n'.join(articles)
+    prompt = (
+        "You are a concise financial news editor. "
+        "From the headlines below, pick the 3 most market-moving items. "
+        "Write a numbered summary in 200 words or less. "
+        "Each item: bold the company/topic (use **bold**), then 1-2 sentences on why it matters. "
+        "No intro sentence — start directly with '1.'.\n\n" + headlines
     )
     try:
-        res = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={'Authorization': f'Bearer {GROQ_KEY}', 'Content-Type': 'application/json'},
-            json={
-                'model': 'llama-3.1-8b-instant',
-                'max_tokens': 350,
-                'temperature': 0.3,
-                'messages': [{'role': 'user', 'content': (
-                    "You are a concise financial news editor. "
-                    "From the headlines below, pick the 3 most market-moving items. "
-                    "Write a numbered summary in 200 words or less. "
-                    "Each item: bold the company/topic (use **bold**), then 1-2 sentences on why it matters. "
-                    "No intro sentence — start directly with '1.'.\n\n" + headlines
-                )}],
-            },
-            timeout=30,
-        )
-        res.raise_for_status()
-        text = res.json()['choices'][0]['message']['content'].strip()
+        text = _groq_call(prompt, max_tokens=350, ttl_secs=2 * 3600)
     except Exception as e:
         return '', f'  News summary failed: {e}\n'
 
     # Detect market mood
     s = text.lower()
-    bull = sum(s.count(w) for w in ['surge','rally','beat','record','gain','rise','strong','growth'])
-    bear = sum(s.count(w) for w in ['fall','drop','miss','concern','fear','risk','weak','decline'])
+    bull = len(_BULL_RE.findall(s))
+    bear = len(_BEAR_RE.findall(s))
     if bull > bear + 1:
         mood, mood_color = '🟢 Bullish', '#22c55e'
     elif bear > bull + 1:
@@ -137,8 +207,7 @@ def build_news_section() -> tuple[str, str]:
         mood, mood_color = '🟡 Mixed / Neutral', '#eab308'
 
     # Convert **bold** to <strong> for HTML
-    import re
-    html_text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    html_text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
     html_text = html_text.replace('\n', '<br>')
 
     html = (
@@ -152,13 +221,15 @@ def build_news_section() -> tuple[str, str]:
 # ─────────────────────────────────────────────────────────────────────────────
 # SECTION 2 — 10-Year Treasury Yield
 # ─────────────────────────────────────────────────────────────────────────────
-def get_10y_yield() -> dict | None:
+def get_10y_yield(closes: list[float] | None = None) -> dict | None:
+    """^TNX yield + daily change — from prefetched `closes` when given, else its own request."""
     try:
-        hist = yf.Ticker('^TNX').history(period='5d')
-        if hist.empty:
+        if closes is None:
+            closes = [float(v) for v in _tk('^TNX').history(period='5d')['Close']]
+        if not closes:
             return None
-        current = round(float(hist['Close'].iloc[-1]), 3)
-        prev    = round(float(hist['Close'].iloc[-2]), 3) if len(hist) >= 2 else None
+        current = round(closes[-1], 3)
+        prev    = round(closes[-2], 3) if len(closes) >= 2 else None
         change  = round(current - prev, 3) if prev is not None else None
         bps     = round(change * 100, 1)   if change is not None else None
         return {'yield': current, 'prev': prev, 'change': change, 'bps': bps}
@@ -173,8 +244,8 @@ def yield_context(y: float) -> str:
     elif y < 5.0: return 'High — restrictive; watch rate-sensitive sectors (tech, real estate)'
     else:          return 'Very high — significant headwind for growth stocks'
 
-def build_bond_section() -> tuple[str, str]:
-    data = get_10y_yield()
+def build_bond_section(closes: dict | None = None) -> tuple[str, str]:
+    data = get_10y_yield(closes.get('^TNX') if closes else None)
     if not data:
         return ('<p style="color:#6b7280">Could not fetch yield data.</p>',
                 '  Could not fetch yield data.\n')
@@ -215,7 +286,7 @@ def build_bond_section() -> tuple[str, str]:
 # ─────────────────────────────────────────────────────────────────────────────
 def get_earnings_date(ticker: str):
     try:
-        cal   = yf.Ticker(ticker).calendar
+        cal   = _tk(ticker).calendar
         if cal is None:
             return None
         dates = cal.get('Earnings Date', [])
@@ -228,17 +299,21 @@ def get_earnings_date(ticker: str):
     except Exception:
         return None
 
+def _fetch_earnings_row(ticker: str, today: date, cutoff: date):
+    """(days_away, ticker, name, date) if earnings fall in [today, cutoff], else None.
+    The name is only looked up for tickers that make it into the table."""
+    d = get_earnings_date(ticker)
+    if not d or not (today <= d <= cutoff):
+        return None
+    return (d - today).days, ticker, ticker_name(ticker), d
+
 def build_earnings_section() -> tuple[str, str]:
     today    = date.today()
     cutoff   = today + timedelta(days=7)
-    upcoming = []
 
-    for ticker in WATCHLIST:
-        d = get_earnings_date(ticker)
-        if d and today <= d <= cutoff:
-            days_away = (d - today).days
-            name = ticker_name(ticker)
-            upcoming.append((days_away, ticker, name, d))
+    with ThreadPoolExecutor(max_workers=min(16, len(WATCHLIST) or 1)) as ex:
+        rows = ex.map(lambda t: _fetch_earnings_row(t, today, cutoff), WATCHLIST)
+        upcoming = [r for r in rows if r]
 
     if not upcoming:
         html  = '<p style="color:#6b7280">No earnings from your watchlist in the next 7 days.</p>'
@@ -246,8 +321,8 @@ def build_earnings_section() -> tuple[str, str]:
         return html, plain
 
     upcoming.sort()
-    rows_html  = ''
-    rows_plain = ''
+    rows_html  = []
+    rows_plain = []
     for days, ticker, name, d in upcoming:
         if days == 0:
             label, badge = 'TODAY 🔴', '#ef4444'
@@ -255,13 +330,13 @@ def build_earnings_section() -> tuple[str, str]:
             label, badge = 'TOMORROW ⚡', '#f97316'
         else:
             label, badge = f'in {days} days', '#6b7280'
-        rows_html  += (
+        rows_html.append(
             f'<tr><td style="padding:6px 12px;font-weight:600">{ticker}</td>'
             f'<td style="padding:6px 12px">{name}</td>'
             f'<td style="padding:6px 12px">{d}</td>'
             f'<td style="padding:6px 12px;color:{badge};font-weight:600">{label}</td></tr>'
         )
-        rows_plain += f'  {ticker:<8} {name[:35]:<35} {str(d):<12} {label}\n'
+        rows_plain.append(f'  {ticker:<8} {name[:35]:<35} {str(d):<12} {label}\n')
 
     html = (
         '<table style="border-collapse:collapse;width:100%">'
@@ -269,17 +344,18 @@ def build_earnings_section() -> tuple[str, str]:
         '<th style="padding:6px 12px;text-align:left">Company</th>'
         '<th style="padding:6px 12px;text-align:left">Date</th>'
         '<th style="padding:6px 12px;text-align:left">When</th></tr>'
-        + rows_html + '</table>'
+        + ''.join(rows_html) + '</table>'
     )
-    return html, rows_plain
+    return html, ''.join(rows_plain)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SECTION 3 — Price Alerts (ALAB & IT only, skip if none triggered)
 # ─────────────────────────────────────────────────────────────────────────────
-def build_price_section() -> tuple[str, str]:
+def build_price_section(prices: dict[str, float]) -> tuple[str, str]:
+    """`prices`: latest close per ALERT_TICKERS symbol; missing symbols are skipped."""
     triggered = []
     for ticker, levels in ALERT_TICKERS.items():
-        price = get_price(ticker)
+        price = prices.get(ticker)
         if price is None:
             continue
         above = levels.get('above')
@@ -295,16 +371,16 @@ def build_price_section() -> tuple[str, str]:
     if not triggered:
         return '', ''   # skip section entirely
 
-    rows_html  = ''
-    rows_plain = ''
+    rows_html  = []
+    rows_plain = []
     for ticker, name, price, direction, pct, color, icon in triggered:
-        rows_html  += (
+        rows_html.append(
             f'<tr><td style="padding:6px 12px">{icon} <strong>{ticker}</strong></td>'
             f'<td style="padding:6px 12px">{name}</td>'
             f'<td style="padding:6px 12px;font-weight:600">${price:.2f}</td>'
             f'<td style="padding:6px 12px;color:{color};font-weight:600">{direction} ({pct})</td></tr>'
         )
-        rows_plain += f'  {icon} {ticker:<8} ${price:.2f}  {direction} ({pct})\n'
+        rows_plain.append(f'  {icon} {ticker:<8} ${price:.2f}  {direction} ({pct})\n')
 
     html = (
         '<table style="border-collapse:collapse;width:100%">'
@@ -312,29 +388,38 @@ def build_price_section() -> tuple[str, str]:
         '<th style="padding:6px 12px;text-align:left">Company</th>'
         '<th style="padding:6px 12px;text-align:left">Price</th>'
         '<th style="padding:6px 12px;text-align:left">Alert</th></tr>'
-        + rows_html + '</table>'
+        + ''.join(rows_html) + '</table>'
     )
-    return html, rows_plain
+    return html, ''.join(rows_plain)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SECTION 5 — Stock News Summary (ALAB & IT, skip if nothing impactful)
 # ─────────────────────────────────────────────────────────────────────────────
 STOCK_SUMMARY_TICKERS = {'ALAB': 'Astera Labs', 'IT': 'Gartner'}
 
+# Bullet parsing: leading UP/DOWN (with or without brackets), trailing [ref:N],
+# and one word-boundary matcher per ticker
+_DIR_RE     = re.compile(r'\[?(UP|DOWN)\]?\s*', re.IGNORECASE)
+_REF_RE     = re.compile(r'\[ref:(\d+)\]\s*$', re.IGNORECASE)
+_TICKER_RES = {t: re.compile(r'\b' + t + r'\b') for t in STOCK_SUMMARY_TICKERS}
+
 def fetch_stock_summary_news(max_per_ticker: int = 10) -> list:
     """
     Returns a flat, deduplicated list of article dicts across ALAB and IT.
     Each dict: {idx, ticker, company, title, summary, url}
     """
     articles, seen = [], set()
-    for ticker, company in STOCK_SUMMARY_TICKERS.items():
+    news_lists = iter_news_lists(STOCK_SUMMARY_TICKERS)
+    for (ticker, company), news in zip(STOCK_SUMMARY_TICKERS.items(), news_lists):
+        count = 0
         try:
-            for item in (yf.Ticker(ticker).news or []):
+            for item in news:
                 content = item.get('content', item)
                 title   = content.get('title', '').strip()
-                if not title or title in seen:
+                key     = _WS_RE.sub(' ', title).lower()   # same story, different spacing/case
+                if not title or key in seen:
                     continue
-                seen.add(title)
+                seen.add(key)
                 summary = content.get('summary', '') or content.get('description', '')
                 url = (
                     (content.get('canonicalUrl') or {}).get('url')
@@ -351,7 +436,8 @@ def fetch_stock_summary_news(max_per_ticker: int = 10) -> list:
                     'summary': summary[:300],
                     'url':     url,
                 })
-                if sum(1 for a in articles if a['ticker'] == ticker) >= max_per_ticker:
+                count += 1
+                if count >= max_per_ticker:
                     break
         except Exception:
             pass
@@ -359,7 +445,6 @@ def fetch_stock_summary_news(max_per_ticker: int = 10) -> list:
 
 def build_stock_summary_section() -> tuple[str, str]:
     """Returns (html_block, plain_block). Returns ('', '') if nothing impactful."""
-    import re as _re
     from collections import defaultdict
     if not GROQ_KEY:
         return '', ''
@@ -396,19 +481,7 @@ def build_stock_summary_section() -> tuple[str, str]:
     )
 
     try:
-        res = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={'Authorization': f'Bearer {GROQ_KEY}', 'Content-Type': 'application/json'},
-            json={
-                'model':       'llama-3.1-8b-instant',
-                'max_tokens':  600,
-                'temperature': 0.3,
-                'messages':    [{'role': 'user', 'content': prompt}],
-            },
-            timeout=30,
-        )
-        res.raise_for_status()
-        text = res.json()['choices'][0]['message']['content'].strip()
+        text = _groq_call(prompt, max_tokens=600, ttl_secs=6 * 3600, stop_prefix='NO_IMPACT')
     except Exception:
         return '', ''
 
@@ -429,14 +502,14 @@ def build_stock_summary_section() -> tuple[str, str]:
     by_ticker    = defaultdict(list)
     for b in bullets_raw:
         # Collect bold phrases, excluding ticker names (they're not topics)
-        topics = [m.lower().strip() for m in _re.findall(r'\*\*(.+?)\*\*', b)
+        topics = [m.lower().strip() for m in _BOLD_RE.findall(b)
                   if m.lower().strip() not in ticker_lower]
         if any(t in seen_topics for t in topics):
             continue
         seen_topics.update(topics)
         # Match ticker using word boundary to avoid 'IT' matching 'INVESTMENT' etc.
         for t in STOCK_SUMMARY_TICKERS:
-            if _re.search(r'\b' + t + r'\b', b):
+            if _TICKER_RES[t].search(b):
                 by_ticker[t].append(b)
                 break
 
@@ -453,7 +526,7 @@ def build_stock_summary_section() -> tuple[str, str]:
         content_str = b[1:].strip()   # strip leading dash
 
         # Match UP or DOWN with or without brackets: [UP], UP, [DOWN], DOWN
-        dir_match = _re.match(r'\[?(UP|DOWN)\]?\s*', content_str, _re.IGNORECASE)
+        dir_match = _DIR_RE.match(content_str)
         if dir_match:
             direction   = dir_match.group(1).upper()
             content_str = content_str[dir_match.end():]
@@ -461,7 +534,7 @@ def build_stock_summary_section() -> tuple[str, str]:
             direction = None
 
         # Extract [ref:N] at end
-        ref_match = _re.search(r'\[ref:(\d+)\]\s*$', content_str, _re.IGNORECASE)
+        ref_match = _REF_RE.search(content_str)
         if ref_match:
             article_url = url_map.get(int(ref_match.group(1)), '')
             content_str = content_str[:ref_match.start()].strip()
@@ -475,8 +548,8 @@ def build_stock_summary_section() -> tuple[str, str]:
         else:
             icon, color = '•', '#6b7280'
 
-        html_text  = _re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', content_str)
-        plain_text = _re.sub(r'\*\*(.+?)\*\*', r'\1', content_str)
+        html_text  = _BOLD_RE.sub(r'<strong>\1</strong>', content_str)
+        plain_text = _BOLD_RE.sub(r'\1', content_str)
 
         link_html = (
             f' <a href="{article_url}" target="_blank" '
@@ -498,44 +571,51 @@ def build_stock_summary_section() -> tuple[str, str]:
 # ─────────────────────────────────────────────────────────────────────────────
 # SECTION 6 — Upcoming Tech IPOs (skip if none)
 # ─────────────────────────────────────────────────────────────────────────────
-def is_tech(name: str) -> bool:
-    return any(kw in name.lower() for kw in IPO_KW)
-
-def load_ipo_seen() -> set:
-    return set(json.loads(IPO_STATE_F.read_text())) if IPO_STATE_F.exists() else set()
+# All IPO_KW keywords as one case-insensitive alternation: one scan per name
+# ('(?!)' never matches, so an empty keyword list still flags nothing)
+_TECH_RE = re.compile('|'.join(re.escape(k) for k in IPO_KW) or '(?!)', re.IGNORECASE)
 
-def save_ipo_seen(seen: set):
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
-    IPO_STATE_F.write_text(json.dumps(sorted(seen), indent=2))
+def is_tech(name: str) -> bool:
+    return bool(_TECH_RE.search(name))
 
 def fetch_upcoming_ipos() -> list:
+    import lxml.html
+    from lxml.etree import ParserError
     year = datetime.now().year
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
     try:
-        res = requests.get(f'https://stockanalysis.com/ipos/{year}/', headers=headers, timeout=15)
+        res = _session().get(f'https://stockanalysis.com/ipos/{year}/', timeout=15)
         res.raise_for_status()
     except Exception:
         return []
-    soup   = BeautifulSoup(res.text, 'html.parser')
-    tables = soup.find_all('table')
+    try:
+        tables = lxml.html.fromstring(res.content).xpath('//table')
+    except ParserError:   # empty / whitespace-only body
+        return []
     table  = tables[1] if len(tables) >= 2 else (tables[0] if tables else None)
-    if not table:
+    if table is None:
         return []
-    ipos, header_row = [], table.find('tr')
-    hdr = [th.get_text(strip=True).lower() for th in header_row.find_all(['th','td'])] if header_row else []
-    def col(cols, *keys):
+    rows = table.xpath('.//tr')
+    if not rows:
+        return []
+    hdr = [c.text_content().strip().lower() for c in rows[0].xpath('./th|./td')]
+    def find_col(*keys):
+        # First header containing any of `keys` (checked in key order), resolved once
         for k in keys:
             for i, h in enumerate(hdr):
-                if k in h and i < len(cols):
-                    return cols[i].get_text(strip=True)
-        return '—'
-    for row in table.find_all('tr')[1:]:
-        cols = row.find_all('td')
-        if len(cols) < 2:
+                if k in h:
+                    return i
+        return None
+    date_i, symbol_i, name_i = find_col('date'), find_col('symbol', 'ticker'), find_col('name', 'company')
+    def col(cells, i):
+        return cells[i] if i is not None and i < len(cells) else '—'
+    ipos = []
+    for row in rows[1:]:
+        cells = [td.text_content().strip() for td in row.xpath('./td')]
+        if len(cells) < 2:
             continue
-        date   = col(cols, 'date') or (cols[0].get_text(strip=True) if cols else '—')
-        symbol = col(cols, 'symbol', 'ticker') or (cols[1].get_text(strip=True) if len(cols)>1 else '—')
-        name   = col(cols, 'name', 'company') or (cols[2].get_text(strip=True) if len(cols)>2 else '—')
+        date   = col(cells, date_i)   or cells[0]
+        symbol = col(cells, symbol_i) or cells[1]
+        name   = col(cells, name_i)   or (cells[2] if len(cells) > 2 else '—')
         if name and name != '—':
             ipos.append({'name': name, 'symbol': symbol, 'date': date})
     return ipos
@@ -547,34 +627,34 @@ def build_ipo_section() -> tuple[str, str]:
     if not tech:
         return '', ''   # skip section
 
-    rows_html  = ''
-    rows_plain = ''
+    rows_html  = []
+    rows_plain = []
     new_syms   = set()
     for ipo in tech:
         is_new = ipo['symbol'] not in seen and ipo['symbol'] != '—'
         if is_new:
             new_syms.add(ipo['symbol'])
         badge = ' <span style="background:#fef08a;padding:1px 6px;border-radius:4px;font-size:11px">NEW ⭐</span>' if is_new else ''
-        rows_html  += (
+        rows_html.append(
             f'<tr><td style="padding:6px 12px;font-weight:600">{ipo["symbol"]}{badge}</td>'
             f'<td style="padding:6px 12px">{ipo["name"]}</td>'
             f'<td style="padding:6px 12px">{ipo["date"]}</td></tr>'
         )
         tag = '⭐ NEW' if is_new else '      '
-        rows_plain += f'  {tag}  {ipo["symbol"]:<8} {ipo["name"][:35]:<35} {ipo["date"]}\n'
+        rows_plain.append(f'  {tag}  {ipo["symbol"]:<8} {ipo["name"][:35]:<35} {ipo["date"]}\n')
 
     html = (
         '<table style="border-collapse:collapse;width:100%">'
         '<tr style="background:#f0fdf4"><th style="padding:6px 12px;text-align:left">Symbol</th>'
         '<th style="padding:6px 12px;text-align:left">Company</th>'
         '<th style="padding:6px 12px;text-align:left">Expected Date</th></tr>'
-        + rows_html + '</table>'
+        + ''.join(rows_html) + '</table>'
         + f'<p style="color:#6b7280;font-size:12px">{len(tech)} upcoming tech IPO(s) — {len(new_syms)} new since last report.</p>'
     )
-    plain = rows_plain + f'\n  {len(tech)} upcoming tech IPO(s) — {len(new_syms)} new since last report.\n'
+    plain = ''.join(rows_plain) + f'\n  {len(tech)} upcoming tech IPO(s) — {len(new_syms)} new since last report.\n'
 
     # Save seen state
-    save_ipo_seen(seen | {i['symbol'] for i in tech if i['symbol'] != '—'})
+    save_ipo_seen({i['symbol'] for i in tech if i['symbol'] != '—'} - seen)
     return html, plain
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -586,27 +666,53 @@ def build_email() -> tuple[str, str]:
     """Returns (html_body, plain_body)."""
     today_str = datetime.now().strftime('%A, %B %d %Y')
 
-    news_html,     news_plain     = build_news_section()
-    bond_html,     bond_plain     = build_bond_section()
-    earnings_html, earnings_plain = build_earnings_section()
-    price_html,    price_plain    = build_price_section()
-    stock_html,    stock_plain    = build_stock_summary_section()
-    ipo_html,      ipo_plain      = build_ipo_section()
+    # Sections are independent of each other — build them all concurrently.
+    # ^TNX and the alert tickers only need daily closes: one yf.download fetches
+    # them in parallel inside the pool, and only the bond and price sections wait on it.
+    with ThreadPoolExecutor(max_workers=7) as ex:
+        closes_f = ex.submit(fetch_closes, ['^TNX', *ALERT_TICKERS])
+
+        def prices():
+            closes = closes_f.result()
+            return {t: round(closes[t][-1], 2) for t in ALERT_TICKERS if closes.get(t)}
+
+        builders = {
+            'news':     build_news_section,
+            'bond':     lambda: build_bond_section(closes_f.result()),
+            'earnings': build_earnings_section,
+            'price':    lambda: build_price_section(prices()),
+            'stock':    build_stock_summary_section,
+            'ipo':      build_ipo_section,
+        }
+        futures = {name: ex.submit(fn) for name, fn in builders.items()}
+
+    news_html,     news_plain     = futures['news'].result()
+    bond_html,     bond_plain     = futures['bond'].result()
+    earnings_html, earnings_plain = futures['earnings'].result()
+    price_html,    price_plain    = futures['price'].result()
+    stock_html,    stock_plain    = futures['stock'].result()
+    ipo_html,      ipo_plain      = futures['ipo'].result()
 
     # ── Plain text ────────────────────────────────────────────────────────────
-    plain = f'DAILY INVESTMENT REPORT — {today_str}\n{"="*60}\n\n'
-    plain += '1. STOCK MARKET NEWS\n' + ('-'*40) + '\n' + news_plain + '\n'
-    plain += '2. 10-YEAR TREASURY YIELD\n' + ('-'*40) + '\n' + bond_plain + '\n'
-    plain += '3. UPCOMING EARNINGS (NEXT 7 DAYS)\n' + ('-'*40) + '\n' + earnings_plain + '\n'
+    def plain_section(title, body):
+        return title + '\n' + ('-'*40) + '\n' + body + '\n'
+
+    plain_parts = [
+        f'DAILY INVESTMENT REPORT — {today_str}\n{"="*60}\n\n',
+        plain_section('1. STOCK MARKET NEWS', news_plain),
+        plain_section('2. 10-YEAR TREASURY YIELD', bond_plain),
+        plain_section('3. UPCOMING EARNINGS (NEXT 7 DAYS)', earnings_plain),
+    ]
     _n = 4
     if price_plain:
-        plain += f'{_n}. PRICE ALERTS — ALAB & GARTNER\n' + ('-'*40) + '\n' + price_plain + '\n'
+        plain_parts.append(plain_section(f'{_n}. PRICE ALERTS — ALAB & GARTNER', price_plain))
         _n += 1
     if stock_plain:
-        plain += f'{_n}. STOCK NEWS SUMMARY — ALAB & GARTNER\n' + ('-'*40) + '\n' + stock_plain + '\n'
+        plain_parts.append(plain_section(f'{_n}. STOCK NEWS SUMMARY — ALAB & GARTNER', stock_plain))
         _n += 1
     if ipo_plain:
-        plain += f'{_n}. UPCOMING TECH IPOs\n' + ('-'*40) + '\n' + ipo_plain + '\n'
+        plain_parts.append(plain_section(f'{_n}. UPCOMING TECH IPOs', ipo_plain))
+    plain = ''.join(plain_parts)
 
     # ── HTML ──────────────────────────────────────────────────────────────────
     def section(title, body, color, bg):
@@ -645,14 +751,78 @@ def build_email() -> tuple[str, str]:
 
     return html, plain
 
-def send_email(subject: str, html_body: str, plain_body: str):
-    smtp_host = cfg.get('smtp_host', 'smtp.gmail.com')
-    smtp_port = int(cfg.get('smtp_port', 587))
-    sender    = cfg.get('sender_email', '')
-    password  = cfg.get('sender_password', '')
-    recipient = cfg.get('recipient_email', '')
-
-    if not all([sender, password, recipient]):
+class EmailSender:
+    """One SMTP session reused across sends: STARTTLS + login are paid once per batch.
+    Use as a context manager; before each send after the first the connection is
+    checked with NOOP and re-established if the server dropped it."""
+
+    def __init__(self, host: str, port: int, user: str, password: str):
+        self.host, self.port = host, port
+        self.user, self.password = user, password
+        self.server = None
+        self._fresh = False   # connected and not used yet — no NOOP needed
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> 'EmailSender':
+        return cls(cfg.get('smtp_host', 'smtp.gmail.com'), int(cfg.get('smtp_port', 587)),
+                   cfg.get('sender_email', ''), cfg.get('sender_password', ''))
+
+    def connect(self):
+        self.close()   # never leave a previous socket behind
+        server = smtplib.SMTP(self.host, self.port)
+        try:
+            server.starttls()
+            server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.server, self._fresh = server, True
+
+    def _ensure_connected(self):
+        if self.server is None:
+            self.connect()
+        elif not self._fresh:   # a just-opened session needs no NOOP round trip
+            try:
+                self.server.noop()
+            except smtplib.SMTPServerDisconnected:
+                self.connect()
+
+    def send(self, msg: MIMEMultipart, recipient: str | list[str]):
+        """One SMTP transaction for all recipients: a RCPT TO each, a single DATA."""
+        self._ensure_connected()
+        self.server.sendmail(self.user, recipient, msg.as_string())
+        self._fresh = False
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                self.server.close()
+            self.server = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def parse_recipients(value) -> list[str]:
+    """recipient_email may be one address, a comma-separated string, or a list."""
+    if isinstance(value, str):
+        value = value.split(',')
+    return [r.strip() for r in value or [] if r and r.strip()]
+
+def send_email(subject: str, html_body: str, plain_body: str, mailer: EmailSender | None = None,
+               recipient: str | list[str] | None = None):
+    """Send the report to `recipient` (default: recipient_email from config) in one
+    SMTP transaction. Pass an open `mailer` to reuse its SMTP session across sends."""
+    sender     = cfg.get('sender_email', '')
+    password   = cfg.get('sender_password', '')
+    recipients = parse_recipients(cfg.get('recipient_email', '') if recipient is None else recipient)
+
+    if not all([sender, password, recipients]):
         print('  ✗ Email config incomplete. Fill in config/email_config.json')
         print('  Plain text report:\n')
         print(plain_body)
@@ -661,16 +831,17 @@ def send_email(subject: str, html_body: str, plain_body: str):
     msg = MIMEMultipart('alternative')
     msg['Subject'] = subject
     msg['From']    = sender
-    msg['To']      = recipient
+    msg['To']      = ', '.join(recipients)
     msg.attach(MIMEText(plain_body, 'plain', 'utf-8'))
     msg.attach(MIMEText(html_body,  'html',  'utf-8'))
 
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.starttls()
-        server.login(sender, password)
-        server.sendmail(sender, recipient, msg.as_string())
+    if mailer is not None:
+        mailer.send(msg, recipients)
+    else:
+        with EmailSender.from_config(cfg) as mailer:
+            mailer.send(msg, recipients)
 
-    print(f'  ✅ Email sent to {recipient}')
+    print(f'  ✅ Email sent to {", ".join(recipients)}')
 
 def main():
     print(f'\n{"="*60}')
@@ -7,28 +7,29 @@ Data source: yfinance (free, no API key)
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-import yfinance as yf
-import json
+import orjson
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+from _cache import get_ticker, short_name
+
 WATCHLIST_FILE = os.path.expanduser('~/investment-agents/config/watchlist.json')
 
 DEFAULT_WATCHLIST = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA']
 
 def load_watchlist() -> list:
     if os.path.exists(WATCHLIST_FILE):
-        with open(WATCHLIST_FILE) as f:
-            return json.load(f)
+        with open(WATCHLIST_FILE, 'rb') as f:
+            return orjson.loads(f.read())
     return DEFAULT_WATCHLIST
 
 def get_earnings_info(ticker: str) -> dict | None:
     """Returns next earnings date info or None."""
     try:
-        t = yf.Ticker(ticker)
+        t = get_ticker(ticker)
         cal = t.calendar
-        info = t.info or {}
-        company = info.get('shortName', ticker)
+        company = short_name(ticker) or ticker
 
         if cal is None:
             return None
@@ -68,8 +69,11 @@ def main():
     upcoming = []   # earnings 3–30 days away
     errors   = []
 
-    for ticker in watchlist:
-        info = get_earnings_info(ticker)
+    # Each lookup is two blocking Yahoo round-trips — overlap them
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(get_earnings_info, watchlist))
+
+    for ticker, info in zip(watchlist, results):
         if info is None:
             errors.append(ticker)
             continue
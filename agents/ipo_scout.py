@@ -8,13 +8,16 @@ import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from lxml import html as lxml_html
+from lxml.etree import ParserError
+import orjson
+import re
 from datetime import datetime
 import os
 import sys
 
-STATE_FILE  = os.path.expanduser('~/investment-agents/state/ipo_seen.json')
+from _state import load_ipo_seen, save_ipo_seen
+
 CONFIG_FILE = os.path.expanduser('~/investment-agents/config/ipo_config.json')
 
 DEFAULT_TECH_KEYWORDS = [
@@ -26,24 +29,16 @@ DEFAULT_TECH_KEYWORDS = [
 
 def load_config():
     if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE) as f:
-            return json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            return orjson.loads(f.read())
     return {'tech_keywords': DEFAULT_TECH_KEYWORDS}
 
-def load_seen() -> set:
-    if os.path.exists(STATE_FILE):
-        with open(STATE_FILE) as f:
-            return set(json.load(f))
-    return set()
-
-def save_seen(seen: set):
-    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
-    with open(STATE_FILE, 'w') as f:
-        json.dump(sorted(seen), f, indent=2)
+def compile_keywords(keywords: list) -> re.Pattern:
+    """All keywords as one case-insensitive alternation ('(?!)' never matches)."""
+    return re.compile('|'.join(re.escape(k) for k in keywords) or '(?!)', re.IGNORECASE)
 
-def is_tech(name: str, keywords: list) -> bool:
-    name_lower = name.lower()
-    return any(kw in name_lower for kw in keywords)
+def is_tech(name: str, tech_re: re.Pattern) -> bool:
+    return bool(tech_re.search(name))
 
 def fetch_upcoming_ipos() -> list:
     year = datetime.now().year
@@ -56,43 +51,60 @@ def fetch_upcoming_ipos() -> list:
         print(f'  ✗ Could not fetch IPO data: {e}')
         return []
 
-    soup = BeautifulSoup(res.text, 'html.parser')
-    tables = soup.find_all('table')
-    ipos   = []
+    ipos = []
+    try:
+        doc = lxml_html.fromstring(res.content)   # C parser
+    except ParserError:   # empty / whitespace-only body
+        return ipos
+    tables = doc.xpath('//table')
 
     # The year page has 2 tables: [0] recent IPOs, [1] upcoming IPOs
     # Fall back to any table if layout changes
     upcoming_table = tables[1] if len(tables) >= 2 else (tables[0] if tables else None)
-    if not upcoming_table:
+    if upcoming_table is None:
+        return ipos
+
+    rows = upcoming_table.xpath('.//tr')
+    if not rows:
         return ipos
 
     # Detect column order from header row
-    header_row = upcoming_table.find('tr')
-    headers_text = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])] if header_row else []
+    headers_text = [c.text_content().strip().lower() for c in rows[0].xpath('./th|./td')]
 
-    def col(cols, *keys):
+    def find_col(*keys):
         for k in keys:
             for i, h in enumerate(headers_text):
-                if k in h and i < len(cols):
-                    return cols[i].get_text(strip=True)
-        return '—'
-
-    rows = upcoming_table.find_all('tr')[1:]
-    for row in rows:
-        cols = row.find_all('td')
-        if len(cols) < 2:
+                if k in h:
+                    return i
+        return None
+
+    # Resolve each field's column once from the header, not per cell
+    header_index = {
+        'date':   find_col('date'),
+        'symbol': find_col('symbol', 'ticker'),
+        'name':   find_col('name', 'company'),
+        'price':  find_col('price', 'range'),
+    }
+
+    def col(cells, field):
+        i = header_index[field]
+        return cells[i] if i is not None and i < len(cells) else '—'
+
+    for row in rows[1:]:
+        cells = [td.text_content().strip() for td in row.xpath('./td')]
+        if len(cells) < 2:
             continue
         # Flexible extraction: works regardless of column order
-        date   = col(cols, 'date')
-        symbol = col(cols, 'symbol', 'ticker')
-        name   = col(cols, 'name', 'company')
-        price  = col(cols, 'price', 'range')
+        date   = col(cells, 'date')
+        symbol = col(cells, 'symbol')
+        name   = col(cells, 'name')
+        price  = col(cells, 'price')
         # Fallback positional if no headers matched
         if date == '—' and name == '—':
-            date   = cols[0].get_text(strip=True) if len(cols) > 0 else '—'
-            symbol = cols[1].get_text(strip=True) if len(cols) > 1 else '—'
-            name   = cols[2].get_text(strip=True) if len(cols) > 2 else '—'
-            price  = cols[3].get_text(strip=True) if len(cols) > 3 else '—'
+            date   = cells[0] if len(cells) > 0 else '—'
+            symbol = cells[1] if len(cells) > 1 else '—'
+            name   = cells[2] if len(cells) > 2 else '—'
+            price  = cells[3] if len(cells) > 3 else '—'
         if name and name != '—':
             ipos.append({'name': name, 'symbol': symbol, 'date': date, 'price_range': price})
 
@@ -105,7 +117,7 @@ def main():
     if sector_filter:
         keywords = [sector_filter.lower()] + keywords
 
-    seen = load_seen()
+    seen = load_ipo_seen()
     ipos = fetch_upcoming_ipos()
 
     print(f"\n{'═'*62}")
@@ -113,14 +125,14 @@ def main():
     print(f"  {datetime.now().strftime('%A, %B %d %Y  %H:%M')}")
     print(f"{'═'*62}\n")
 
-    tech_ipos = [ipo for ipo in ipos if is_tech(ipo['name'], keywords)]
+    tech_re   = compile_keywords(keywords)
+    tech_ipos = [ipo for ipo in ipos if is_tech(ipo['name'], tech_re)]
 
     if not tech_ipos:
         print('  No upcoming tech IPOs found at this time.\n')
         return
 
     new_count = 0
-    new_seen  = set(seen)
 
     print(f"  {'':4}  {'Symbol':<8}  {'Company':<32}  {'Date':<14}  {'Price Range'}")
     print(f"  {'─'*4}  {'─'*8}  {'─'*32}  {'─'*14}  {'─'*14}")
@@ -129,7 +141,6 @@ def main():
         is_new = ipo['symbol'] not in seen and ipo['symbol'] != '—'
         if is_new:
             new_count += 1
-            new_seen.add(ipo['symbol'])
             tag = '⭐'
         else:
             tag = '  '
@@ -139,7 +150,7 @@ def main():
 
     print(f"\n  {len(tech_ipos)} tech IPO(s) upcoming.  ⭐ {new_count} new since last run.\n")
 
-    save_seen(new_seen | {ipo['symbol'] for ipo in tech_ipos if ipo['symbol'] != '—'})
+    save_ipo_seen({ipo['symbol'] for ipo in tech_ipos if ipo['symbol'] != '—'} - seen)
 
 if __name__ == '__main__':
     main()
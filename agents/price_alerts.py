@@ -8,10 +8,13 @@ import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
 import yfinance as yf
-import json
+import orjson
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+from _cache import short_name
+
 THRESHOLDS_FILE = os.path.expanduser('~/investment-agents/config/thresholds.json')
 
 DEFAULT_THRESHOLDS = {
@@ -25,26 +28,29 @@ DEFAULT_THRESHOLDS = {
 
 def load_thresholds() -> dict:
     if os.path.exists(THRESHOLDS_FILE):
-        with open(THRESHOLDS_FILE) as f:
-            return json.load(f)
+        with open(THRESHOLDS_FILE, 'rb') as f:
+            return orjson.loads(f.read())
     # Write defaults on first run
     os.makedirs(os.path.dirname(THRESHOLDS_FILE), exist_ok=True)
-    with open(THRESHOLDS_FILE, 'w') as f:
-        json.dump(DEFAULT_THRESHOLDS, f, indent=2)
+    with open(THRESHOLDS_FILE, 'wb') as f:
+        f.write(orjson.dumps(DEFAULT_THRESHOLDS, option=orjson.OPT_INDENT_2))
     return DEFAULT_THRESHOLDS
 
-def get_price_and_info(ticker: str) -> tuple[float | None, str]:
-    """Returns (current_price, company_name)."""
+def get_prices(tickers: list) -> dict:
+    """Latest close for every ticker from one yf.download call (per-ticker requests, in parallel).
+    Returns {ticker: price or None}."""
     try:
-        t    = yf.Ticker(ticker)
-        hist = t.history(period='1d')
-        if hist.empty:
-            return None, ticker
-        price   = round(float(hist['Close'].iloc[-1]), 2)
-        company = (t.info or {}).get('shortName', ticker)
-        return price, company
+        df = yf.download(tickers, period='1d', group_by='ticker', threads=True, progress=False)
     except Exception:
-        return None, ticker
+        return {t: None for t in tickers}
+    prices = {}
+    for ticker in tickers:
+        try:
+            close = (df[ticker] if df.columns.nlevels > 1 else df)['Close'].dropna()
+            prices[ticker] = round(float(close.iloc[-1]), 2) if not close.empty else None
+        except Exception:
+            prices[ticker] = None
+    return prices
 
 def pct(price: float, threshold: float) -> str:
     diff = (price - threshold) / threshold * 100
@@ -61,11 +67,20 @@ def main():
     within     = []
     failed     = []
 
+    # One yf.download call for all prices. Company names are resolved only for
+    # tickers that got a price (they're never shown for failed ones), from the
+    # 90-day disk cache, with only cache misses hitting .info (concurrently)
+    prices = get_prices(list(thresholds))
+    priced = [t for t, p in prices.items() if p is not None]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        names = dict(zip(priced, ex.map(short_name, priced)))
+
     for ticker, levels in thresholds.items():
-        price, company = get_price_and_info(ticker)
+        price = prices[ticker]
         if price is None:
             failed.append(ticker)
             continue
+        company = names[ticker] or ticker
 
         above = levels.get('above')
         below = levels.get('below')
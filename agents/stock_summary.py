@@ -14,11 +14,13 @@ Requires: groq_api_key in ~/investment-agents/config/email_config.json
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-import os, json, re, requests
+import os, json, re
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-import yfinance as yf
+from _cache import ticker_news
+from _http import groq_stream
 
 # ── Config ────────────────────────────────────────────────────────────────────
 BASE      = Path.home() / 'investment-agents'
@@ -34,21 +36,35 @@ def _load_groq_key() -> str:
 GROQ_KEY      = _load_groq_key() or os.environ.get('GROQ_API_KEY', '')
 STOCK_TICKERS = {'ALAB': 'Astera Labs', 'IT': 'Gartner'}
 
+# Compiled once: **bold** topic, leading UP/DOWN, trailing [ref:N], ticker mentions,
+# and the whitespace runs collapsed in a headline's dedup key
+_BOLD_RE    = re.compile(r'\*\*(.+?)\*\*')
+_DIR_RE     = re.compile(r'\[?(UP|DOWN)\]?\s*', re.IGNORECASE)
+_REF_RE     = re.compile(r'\[ref:(\d+)\]\s*$', re.IGNORECASE)
+_TICKER_RES = {t: re.compile(rf'\b{t}\b') for t in STOCK_TICKERS}
+_WS_RE      = re.compile(r'\s+')
+
 # ── News Fetching ─────────────────────────────────────────────────────────────
 def fetch_stock_news(max_per_ticker: int = 10) -> list:
     """
     Returns a flat, deduplicated list of article dicts across ALAB and IT.
     Each dict: {idx, ticker, company, title, summary, url}
+    News for all tickers is fetched concurrently; dedup keeps STOCK_TICKERS order.
     """
+    with ThreadPoolExecutor(max_workers=len(STOCK_TICKERS)) as ex:
+        news_lists = list(ex.map(ticker_news, STOCK_TICKERS))
+
     articles, seen = [], set()
-    for ticker, company in STOCK_TICKERS.items():
+    for (ticker, company), news in zip(STOCK_TICKERS.items(), news_lists):
+        count = 0
         try:
-            for item in (yf.Ticker(ticker).news or []):
+            for item in news:
                 content = item.get('content', item)
                 title   = content.get('title', '').strip()
-                if not title or title in seen:
+                key     = _WS_RE.sub(' ', title).lower()
+                if not title or key in seen:
                     continue
-                seen.add(title)
+                seen.add(key)
                 summary = content.get('summary', '') or content.get('description', '')
                 url = (
                     (content.get('canonicalUrl') or {}).get('url')
@@ -65,7 +81,8 @@ def fetch_stock_news(max_per_ticker: int = 10) -> list:
                     'summary': summary[:300],
                     'url':     url,
                 })
-                if sum(1 for a in articles if a['ticker'] == ticker) >= max_per_ticker:
+                count += 1
+                if count >= max_per_ticker:
                     break
         except Exception:
             pass
@@ -107,19 +124,8 @@ def summarize_with_groq(articles: list) -> str | None:
     )
 
     try:
-        res = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={'Authorization': f'Bearer {GROQ_KEY}', 'Content-Type': 'application/json'},
-            json={
-                'model':       'llama-3.1-8b-instant',
-                'max_tokens':  600,
-                'temperature': 0.3,
-                'messages':    [{'role': 'user', 'content': prompt}],
-            },
-            timeout=30,
-        )
-        res.raise_for_status()
-        text = res.json()['choices'][0]['message']['content'].strip()
+        # Streamed; a NO_IMPACT reply is cut off after its first tokens
+        text = groq_stream(GROQ_KEY, prompt, max_tokens=600, stop_prefix='NO_IMPACT')
     except Exception:
         return None
 
@@ -161,13 +167,13 @@ def main():
     seen_topics  = set()
     by_ticker    = defaultdict(list)
     for b in bullets_raw:
-        topics = [m.lower().strip() for m in re.findall(r'\*\*(.+?)\*\*', b)
+        topics = [m.lower().strip() for m in _BOLD_RE.findall(b)
                   if m.lower().strip() not in ticker_lower]
         if any(t in seen_topics for t in topics):
             continue
         seen_topics.update(topics)
-        for t in STOCK_TICKERS:
-            if re.search(r'\b' + t + r'\b', b):
+        for t, pat in _TICKER_RES.items():
+            if pat.search(b):
                 by_ticker[t].append(b)
                 break
 
@@ -178,17 +184,17 @@ def main():
     for b in final_bullets:
         content_str = b[1:].strip()
 
-        dir_match  = re.match(r'\[?(UP|DOWN)\]?\s*', content_str, re.IGNORECASE)
+        dir_match  = _DIR_RE.match(content_str)
         direction  = dir_match.group(1).upper() if dir_match else None
         if dir_match:
             content_str = content_str[dir_match.end():]
 
-        ref_match   = re.search(r'\[ref:(\d+)\]\s*$', content_str, re.IGNORECASE)
+        ref_match   = _REF_RE.search(content_str)
         article_url = url_map.get(int(ref_match.group(1)), '') if ref_match else ''
         if ref_match:
             content_str = content_str[:ref_match.start()].strip()
 
-        plain_text = re.sub(r'\*\*(.+?)\*\*', r'\1', content_str)
+        plain_text = _BOLD_RE.sub(r'\1', content_str)
         icon       = '📈' if direction == 'UP' else ('📉' if direction == 'DOWN' else '•')
         url_str    = f'\n     {article_url}' if article_url else ''
         print(f"  {icon} {plain_text}{url_str}\n")